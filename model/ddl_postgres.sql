@@ -47,7 +47,10 @@ CREATE TABLE IF NOT EXISTS movies_app.movie_genre (
   PRIMARY KEY (movie_id, genre_id)
 );
 
+-- Unique functional index: gives the loader an ON CONFLICT target for
+-- case-insensitive title/year upserts and indexes title lookups
+CREATE UNIQUE INDEX IF NOT EXISTS movie_title_year_ci ON movies_app.movie(LOWER(title), year_start);
+
 -- Indexes for performance on common queries
-CREATE INDEX IF NOT EXISTS idx_movie_title ON movies_app.movie(LOWER(title));
 CREATE INDEX IF NOT EXISTS idx_movie_year_start ON movies_app.movie(year_start);
 CREATE INDEX IF NOT EXISTS idx_movie_gross ON movies_app.movie(gross DESC);